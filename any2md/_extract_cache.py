@@ -0,0 +1,106 @@
+"""On-disk cache of backend extraction results, keyed on input content.
+
+Opt-in via ``PipelineOptions.extraction_cache`` (CLI ``--cache``). Entries
+live under ``<output_dir>/.cache/`` as one JSON file per key. A key is the
+SHA-256 of the input bytes combined with a converter-supplied tag that
+names the backend, its installed version, and every option that changes
+the extracted markdown. ``_CACHE_VERSION`` salts every key; bump it when
+a converter's extraction step changes output for the same inputs.
+
+Only the backend step (Docling / pymupdf4llm / mammoth) is cached. The
+pipeline and frontmatter always re-run, so ``--profile``, ``--meta`` and
+date-derived fields stay correct on a cache hit.
+
+Internal module; names here may change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+
+from any2md import _logging
+from any2md.utils import atomic_write_text
+
+_CACHE_VERSION = 1
+
+CACHE_DIRNAME = ".cache"
+
+_HASH_CHUNK = 1 << 20
+
+
+@dataclass(frozen=True)
+class CachedExtraction:
+    markdown: str
+    extracted_via: str
+    lane: str
+    # Run-level warnings the extraction step produced (e.g. the DOCX
+    # msword_backend fallback), replayed on a hit so --strict still fires.
+    warnings: list[str] = field(default_factory=list)
+
+
+def backend_version(dist: str) -> str:
+    """Installed version of ``dist``, or ``"unknown"`` if not installed."""
+    try:
+        return version(dist)
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def cache_key(input_path: Path, tag: str) -> str:
+    """Hex key for ``input_path``'s bytes extracted under ``tag``."""
+    content = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        while chunk := f.read(_HASH_CHUNK):
+            content.update(chunk)
+    salted = f"{_CACHE_VERSION}\0{tag}\0{content.hexdigest()}"
+    return hashlib.sha256(salted.encode("utf-8")).hexdigest()
+
+
+def _entry_path(output_dir: Path, key: str) -> Path:
+    return output_dir / CACHE_DIRNAME / f"{key}.json"
+
+
+def load(output_dir: Path, key: str) -> CachedExtraction | None:
+    """Return the cached extraction for ``key``, or None on miss.
+
+    Unreadable, corrupt, or stale-version entries count as misses.
+    """
+    try:
+        data = json.loads(_entry_path(output_dir, key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return None
+    markdown = data.get("markdown")
+    extracted_via = data.get("extracted_via")
+    lane = data.get("lane")
+    warnings = data.get("warnings", [])
+    if not (
+        isinstance(markdown, str)
+        and isinstance(extracted_via, str)
+        and lane in ("structured", "text")
+        and isinstance(warnings, list)
+        and all(isinstance(w, str) for w in warnings)
+    ):
+        return None
+    return CachedExtraction(markdown, extracted_via, lane, list(warnings))
+
+
+def store(output_dir: Path, key: str, entry: CachedExtraction) -> None:
+    """Persist ``entry`` under ``key``. Failures warn but never raise."""
+    payload = {
+        "version": _CACHE_VERSION,
+        "markdown": entry.markdown,
+        "extracted_via": entry.extracted_via,
+        "lane": entry.lane,
+        "warnings": entry.warnings,
+    }
+    path = _entry_path(output_dir, key)
+    try:
+        atomic_write_text(path, json.dumps(payload, ensure_ascii=False))
+    except (OSError, ValueError) as e:
+        _logging.warn(f"could not write extraction cache entry {path.name}: {e}")
@@ -1,6 +1,7 @@
 """CLI entry point for any2md."""
 
 import argparse
+import os
 import sys
 import time
 from pathlib import Path
@@ -16,12 +17,11 @@ from any2md.config import (
 from any2md.converters import (
     SUPPORTED_EXTENSIONS,
     collected_warnings,
-    convert_file,
+    convert_many,
     reset_warnings,
     set_output_mode,
 )
-from any2md.converters.html import convert_url
-from any2md.frontmatter import filter_reserved_overrides
+from any2md.frontmatter import _deep_merge, filter_reserved_overrides
 from any2md.pipeline import PipelineOptions
 from any2md.utils import sanitize_filename, url_to_filename
 
@@ -57,21 +57,17 @@ def parse_meta_args(meta_args: list[str]) -> dict[str, Any]:
     return out
 
 
-def _deep_merge_overrides(
-    base: dict[str, Any], overrides: dict[str, Any]
-) -> dict[str, Any]:
-    """Deep-merge ``overrides`` into ``base`` (CLI-side mirror of frontmatter._deep_merge).
+def _existing_outputs(output_dir: Path) -> frozenset[str]:
+    """Names already present in ``output_dir`` (empty if it doesn't exist).
 
-    Used to combine config-file overrides with CLI ``--meta`` overrides
-    before forwarding the result into ``PipelineOptions``.
+    One directory read up front lets the batch skip checks test set
+    membership instead of stat-ing every candidate output path.
     """
-    out = dict(base)
-    for key, val in overrides.items():
-        if key in out and isinstance(out[key], dict) and isinstance(val, dict):
-            out[key] = _deep_merge_overrides(out[key], val)
-        else:
-            out[key] = val
-    return out
+    try:
+        with os.scandir(output_dir) as it:
+            return frozenset(entry.name for entry in it)
+    except (FileNotFoundError, NotADirectoryError):
+        return frozenset()
 
 
 def main():
@@ -124,6 +120,21 @@ def main():
         default=_DEFAULT_MAX_FILE_SIZE,
         help=f"Maximum file size in bytes (default: {_DEFAULT_MAX_FILE_SIZE}).",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert local files in N parallel worker processes "
+        "(default: 1, sequential). 0 uses one worker per CPU.",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache PDF/DOCX backend extraction under <output-dir>/.cache/, "
+        "keyed on input content, and reuse it on later runs.",
+    )
     parser.add_argument(
         "--high-fidelity",
         "-H",
@@ -223,6 +234,8 @@ def main():
         ".any2md.toml is auto-discovered by walking up from cwd.",
     )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be >= 0")
 
     # Resolution order: discovered .any2md.toml → --meta-file → --meta
     # (highest priority last). Each layer deep-merges over the previous.
@@ -232,7 +245,7 @@ def main():
     discovered = None if args.no_config else discover_config()
     if discovered is not None:
         cfg = load_toml(discovered)
-        overrides = _deep_merge_overrides(overrides, extract_meta_overrides(cfg))
+        overrides = _deep_merge(overrides, extract_meta_overrides(cfg))
         auto_id_prefix, auto_id_type_code = extract_document_id_settings(cfg)
 
     if args.meta_file is not None:
@@ -242,7 +255,7 @@ def main():
             )
             sys.exit(1)
         cfg = load_toml(args.meta_file)
-        overrides = _deep_merge_overrides(overrides, extract_meta_overrides(cfg))
+        overrides = _deep_merge(overrides, extract_meta_overrides(cfg))
         # Only adopt id settings if the file actually declared them — a
         # bare --meta-file shouldn't reset values pulled from .any2md.toml.
         id_section = cfg.get("document_id", {}) if isinstance(cfg, dict) else {}
@@ -257,7 +270,7 @@ def main():
     except ValueError as e:
         sys.stderr.write(f"Error: {_logging.safe_oneline(str(e))}\n")
         sys.exit(1)
-    overrides = _deep_merge_overrides(overrides, cli_meta)
+    overrides = _deep_merge(overrides, cli_meta)
     overrides = filter_reserved_overrides(
         overrides, source_label="--meta/--meta-file/.any2md.toml"
     )
@@ -295,6 +308,7 @@ def main():
         backend=args.backend,
         arxiv_lookup=not args.no_arxiv_lookup,
         docx_fallback_on_warn=args.docx_fallback_on_warn,
+        extraction_cache=args.cache,
     )
 
     # CLI-only output controls (not part of PipelineOptions).
@@ -365,31 +379,49 @@ def main():
     fail = 0
     skip = 0
 
-    # Process URLs
+    # Process URLs. Skips are decided first so only the remaining pages
+    # are fetched (concurrently) before being converted in order.
+    # URLs sharing an output name (repeats, differing query strings) are
+    # skipped after the first unless --force, and are never fetched.
+    pending_urls: list[str] = []
+    claimed_urls: set[str] = set()
+    existing = frozenset() if args.force else _existing_outputs(args.output_dir)
     for url in urls:
         out_name = url_to_filename(url)
-        out_path = args.output_dir / out_name
-        if out_path.exists() and not args.force:
+        if (out_name in existing or out_name in claimed_urls) and not args.force:
             print(f"  SKIP (exists): {out_name}")
             skip += 1
             continue
+        claimed_urls.add(out_name)
+        pending_urls.append(url)
 
-        result = convert_url(
-            url,
+    if pending_urls:
+        # Deferred: the HTML converter pulls in trafilatura, which would
+        # otherwise dominate startup for file-only runs.
+        from any2md.converters.html import convert_urls
+
+        for _url, result in convert_urls(
+            pending_urls,
             args.output_dir,
             options=options,
             force=args.force,
-        )
-        if result:
-            ok += 1
-        else:
-            fail += 1
-
-    # Process local files
+        ):
+            if result:
+                ok += 1
+            else:
+                fail += 1
+
+    # Process local files. Skip and size checks run up front in this
+    # process so the conversions themselves can fan out over --jobs.
+    # Re-listed after the URL pass, which may have written outputs. Under
+    # --force, inputs sharing an output name are all kept; convert_many
+    # runs them in order so the last one wins, as it would sequentially.
+    pending: list[Path] = []
+    claimed: set[str] = set()
+    existing = frozenset() if args.force else _existing_outputs(args.output_dir)
     for file_path in file_paths:
         out_name = sanitize_filename(file_path.name)
-        out_path = args.output_dir / out_name
-        if out_path.exists() and not args.force:
+        if (out_name in existing or out_name in claimed) and not args.force:
             print(f"  SKIP (exists): {out_name}")
             skip += 1
             continue
@@ -410,12 +442,16 @@ def main():
             skip += 1
             continue
 
-        result = convert_file(
-            file_path,
-            args.output_dir,
-            options=options,
-            force=args.force,
-        )
+        claimed.add(out_name)
+        pending.append(file_path)
+
+    for _file_path, result in convert_many(
+        pending,
+        args.output_dir,
+        options=options,
+        force=args.force,
+        max_workers=args.jobs or None,
+    ):
         if result:
             ok += 1
         else:
@@ -1,9 +1,18 @@
 """Converter dispatcher for any2md."""
 
+import importlib
+import io
+import os
+import sys
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 
 from any2md import _logging
 from any2md.pipeline import PipelineOptions
+from any2md.utils import sanitize_filename
 
 SUPPORTED_EXTENSIONS = {".pdf", ".docx", ".html", ".htm", ".txt"}
 
@@ -86,3 +95,127 @@ def convert_file(
         return convert_txt(file_path, output_dir, options=options, force=force)
     _logging.fail(f"{file_path.name} (no converter for {ext})", prefix="UNSUPPORTED")
     return False
+
+
+# Converter module a pool worker imports up front for each input
+# extension, so the module and its eager dependencies (pymupdf, lxml,
+# trafilatura, ...) load once per worker before any task is handed out
+# rather than inside the first conversion. Fallback-only backends such as
+# pymupdf4llm stay lazy; pymupdf4llm also prints a notice on import that
+# would otherwise repeat once per worker.
+_WORKER_PRELOADS: dict[str, str] = {
+    ".pdf": "any2md.converters.pdf",
+    ".docx": "any2md.converters.docx",
+    ".html": "any2md.converters.html",
+    ".htm": "any2md.converters.html",
+    ".txt": "any2md.converters.txt",
+}
+
+
+def _init_worker(quiet: bool, verbose: bool, suffixes: frozenset[str]) -> None:
+    """Process-pool initializer: apply the CLI output mode and preload.
+
+    Runs once per child process. Preloading is best-effort; a module that
+    fails to import here fails again, with a proper per-file error, when
+    its converter runs.
+    """
+    set_output_mode(quiet=quiet, verbose=verbose)
+    modules = {_WORKER_PRELOADS[s] for s in suffixes if s in _WORKER_PRELOADS}
+    for module in sorted(modules):
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _convert_task(
+    file_path: Path,
+    output_dir: Path,
+    options: PipelineOptions,
+    force: bool,
+) -> tuple[bool, list[str], str, str]:
+    """Process-pool worker: convert one file.
+
+    Returns ``(ok, warnings, stdout, stderr)``. Runs in a child process set
+    up by ``_init_worker``. The pipeline warnings are shipped back to the
+    parent rather than left in the child's copy of the run-level
+    accumulator, and the converter's console output is captured so the
+    parent can print each file's lines whole instead of letting workers
+    interleave writes on the shared streams.
+    """
+    reset_warnings()
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            ok = convert_file(file_path, output_dir, options=options, force=force)
+    except BaseException:
+        sys.stdout.write(out.getvalue())
+        sys.stderr.write(err.getvalue())
+        raise
+    return ok, collected_warnings(), out.getvalue(), err.getvalue()
+
+
+def convert_many(
+    file_paths: Sequence[Path],
+    output_dir: Path,
+    options: PipelineOptions | None = None,
+    force: bool = False,
+    max_workers: int | None = 1,
+) -> Iterator[tuple[Path, bool]]:
+    """Convert ``file_paths``, yielding ``(path, ok)`` as each file finishes.
+
+    ``max_workers=1`` (the default) converts in-process and in order.
+    Larger values fan the files out over a ``ProcessPoolExecutor``
+    (``None`` means one worker per CPU); results then arrive in completion
+    order and each worker's pipeline warnings are merged into this
+    process's run-level accumulator. Inputs that map to the same output
+    name still run one after another in input order, so the last one
+    wins exactly as in a sequential run.
+    """
+    if options is None:
+        options = PipelineOptions()
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(file_paths))
+
+    if max_workers <= 1:
+        for file_path in file_paths:
+            yield (
+                file_path,
+                convert_file(file_path, output_dir, options=options, force=force),
+            )
+        return
+
+    # Create the output directory once in the parent so workers never
+    # race on mkdir.
+    output_dir.mkdir(parents=True, exist_ok=True)
+    suffixes = frozenset(fp.suffix.lower() for fp in file_paths)
+    # Per output name, the inputs still waiting to run, in input order.
+    queued: dict[str, deque[Path]] = {}
+    for fp in file_paths:
+        queued.setdefault(sanitize_filename(fp.name), deque()).append(fp)
+    running: dict[Future, tuple[Path, str]] = {}
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(_QUIET, _VERBOSE, suffixes),
+    ) as executor:
+
+        def submit_next(out_name: str) -> None:
+            fp = queued[out_name].popleft()
+            future = executor.submit(_convert_task, fp, output_dir, options, force)
+            running[future] = (fp, out_name)
+
+        for out_name in queued:
+            submit_next(out_name)
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                fp, out_name = running.pop(future)
+                if queued[out_name]:
+                    submit_next(out_name)
+                ok, warnings, out, err = future.result()
+                add_warnings(warnings)
+                sys.stdout.write(out)
+                sys.stderr.write(err)
+                yield fp, ok
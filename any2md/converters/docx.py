@@ -9,6 +9,7 @@ produces the markdown body.
 
 from __future__ import annotations
 
+import io
 import logging
 import sys
 import zipfile
@@ -18,17 +19,19 @@ from defusedxml.ElementTree import parse as _xml_parse
 from datetime import date
 from pathlib import Path
 
-import mammoth
-import markdownify
-
-from any2md import _logging, pipeline
+from any2md import _extract_cache, _logging, pipeline
 from any2md._docling import has_docling
 from any2md._logging import _sanitize_log_text  # noqa: F401  # re-export shim for v1.1.x; remove in v1.2
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.heuristics import filter_organization
 from any2md.pipeline import PipelineOptions
-from any2md.utils import atomic_write_text, sanitize_filename
+from any2md.utils import (
+    atomic_write_text,
+    count_words,
+    read_file_bytes,
+    sanitize_filename,
+)
 
 
 _DOCLING_MSWORD_LOGGER = "docling.backend.msword_backend"
@@ -182,8 +185,14 @@ def _extract_via_docling(docx_path: Path) -> tuple[str, str, list[str]]:
 
 
 def _extract_via_mammoth(docx_path: Path, options: PipelineOptions) -> tuple[str, str]:
-    with open(docx_path, "rb") as f:
-        html_result = mammoth.convert_to_html(f)
+    # Only the fallback lane needs these; importing them here keeps them
+    # out of Docling runs.
+    import mammoth
+    import markdownify
+
+    # mammoth walks the zip with many small seek+read pairs; serve them
+    # from memory instead of through a buffered file.
+    html_result = mammoth.convert_to_html(io.BytesIO(read_file_bytes(docx_path)))
     md = markdownify.markdownify(
         html_result.value,
         heading_style="ATX",
@@ -221,59 +230,100 @@ def convert_docx(
             )
             return False
 
-        docling_warnings: list[str] = []
-        if options.backend == "mammoth":
-            md_text, extracted_via = _extract_via_mammoth(docx_path, options)
-            lane = "text"
-        elif options.backend == "docling":
-            md_text, extracted_via, docling_warnings = _extract_via_docling(docx_path)
-            lane = "structured"
-        elif has_docling():
-            try:
+        # Cached extraction (--cache). Bypassed under --save-images so the
+        # image handling always reflects the current run.
+        cache_key = None
+        cached = None
+        if options.extraction_cache and not options.save_images:
+            backend = options.backend or ("docling" if has_docling() else "mammoth")
+            tag = ":".join(
+                [
+                    "docx",
+                    backend,
+                    *(
+                        _extract_cache.backend_version(dist)
+                        for dist in ("docling", "mammoth", "markdownify")
+                    ),
+                    f"fallback_on_warn={options.docx_fallback_on_warn}",
+                ]
+            )
+            cache_key = _extract_cache.cache_key(docx_path, tag)
+            cached = _extract_cache.load(output_dir, cache_key)
+
+        extract_warnings: list[str] = []
+        if cached is not None:
+            md_text, extracted_via, lane = (
+                cached.markdown,
+                cached.extracted_via,
+                cached.lane,
+            )
+            extract_warnings = list(cached.warnings)
+        else:
+            docling_warnings: list[str] = []
+            if options.backend == "mammoth":
+                md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+                lane = "text"
+            elif options.backend == "docling":
                 md_text, extracted_via, docling_warnings = _extract_via_docling(
                     docx_path
                 )
                 lane = "structured"
-            except Exception as e:  # noqa: BLE001 — fall back rather than fail
+            elif has_docling():
+                try:
+                    md_text, extracted_via, docling_warnings = _extract_via_docling(
+                        docx_path
+                    )
+                    lane = "structured"
+                except Exception as e:  # noqa: BLE001 — fall back rather than fail
+                    print(
+                        f"  WARN: Docling extraction failed for {docx_path.name}: {e}; "
+                        f"falling back to mammoth.",
+                        file=sys.stderr,
+                    )
+                    md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+                    lane = "text"
+                    docling_warnings = []
+                    # Don't pin a possibly transient Docling failure.
+                    cache_key = None
+            else:
+                md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+                lane = "text"
+
+            # v1.0.5: Docling's DOCX backend silently drops list items in a
+            # known malformed-input path. When any msword_backend warning
+            # fires, swap the Docling output for the mammoth lane (different
+            # parser, generally more permissive). Captured warnings are
+            # forwarded into the run-level warning bucket so --strict still
+            # fails on them.
+            if (
+                docling_warnings
+                and options.docx_fallback_on_warn
+                and extracted_via == "docling"
+            ):
                 print(
-                    f"  WARN: Docling extraction failed for {docx_path.name}: {e}; "
-                    f"falling back to mammoth.",
+                    f"  FALLBACK: {docx_path.name} -- Docling emitted "
+                    f"{len(docling_warnings)} msword_backend warning(s); "
+                    f"re-running via mammoth (content may have been dropped "
+                    f"by Docling).",
                     file=sys.stderr,
                 )
-                md_text, extracted_via = _extract_via_mammoth(docx_path, options)
+                md_text, _ = _extract_via_mammoth(docx_path, options)
+                extracted_via = "docling→mammoth (warning fallback)"
                 lane = "text"
-                docling_warnings = []
-        else:
-            md_text, extracted_via = _extract_via_mammoth(docx_path, options)
-            lane = "text"
-
-        # v1.0.5: Docling's DOCX backend silently drops list items in a
-        # known malformed-input path. When any msword_backend warning
-        # fires, swap the Docling output for the mammoth lane (different
-        # parser, generally more permissive). Captured warnings are
-        # forwarded into the run-level warning bucket so --strict still
-        # fails on them.
-        if (
-            docling_warnings
-            and options.docx_fallback_on_warn
-            and extracted_via == "docling"
-        ):
-            print(
-                f"  FALLBACK: {docx_path.name} -- Docling emitted "
-                f"{len(docling_warnings)} msword_backend warning(s); "
-                f"re-running via mammoth (content may have been dropped "
-                f"by Docling).",
-                file=sys.stderr,
-            )
-            md_text, _ = _extract_via_mammoth(docx_path, options)
-            extracted_via = "docling→mammoth (warning fallback)"
-            lane = "text"
-            add_warnings(
-                [
+                extract_warnings = [
                     f"docling.msword_backend: {_sanitize_log_text(m)}"
                     for m in docling_warnings
                 ]
-            )
+
+            if cache_key is not None:
+                _extract_cache.store(
+                    output_dir,
+                    cache_key,
+                    _extract_cache.CachedExtraction(
+                        md_text, extracted_via, lane, extract_warnings
+                    ),
+                )
+        add_warnings(extract_warnings)
 
         md_text, warnings = pipeline.run(md_text, lane, options)
         add_warnings(warnings)
@@ -289,7 +339,7 @@ def convert_docx(
             ),
             keywords=props["keywords"],
             pages=None,
-            word_count=len(md_text.split()),
+            word_count=count_words(md_text),
             source_file=docx_path.name,
             source_url=None,
             doc_type="docx",
@@ -297,10 +347,12 @@ def convert_docx(
             lane=lane,
             produced_by=props["produced_by"],
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        parts = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, parts)
         wc = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
@@ -3,21 +3,25 @@
 from __future__ import annotations
 
 import sys
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from email.utils import parsedate_to_datetime
 from pathlib import Path
 
-import markdownify
 import trafilatura
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
 from any2md import _logging, pipeline
 from any2md._http import safe_fetch
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.pipeline import PipelineOptions
 from any2md.utils import (
     atomic_write_text,
+    count_words,
     read_text_with_fallback,
     sanitize_filename,
     scrub_url_credentials,
@@ -27,6 +31,10 @@ from any2md.utils import (
 
 _MAX_FILE_SIZE = 100 * 1024 * 1024
 
+# Concurrent fetches for convert_urls. Fetching is latency-bound, so this
+# is independent of --jobs (which sizes the CPU-bound conversion pool).
+_FETCH_WORKERS = 8
+
 
 def fetch_url(url: str) -> tuple[str | None, str | None]:
     """Fetch HTML from a URL using the SSRF-safe fetcher.
@@ -35,12 +43,52 @@ def fetch_url(url: str) -> tuple[str | None, str | None]:
     on failure. Per-hop host revalidation defends against DNS rebind
     via redirects.
     """
-    body, _headers, err = safe_fetch(url)
+    html_content, _headers, err = _fetch_page(url)
+    return html_content, err
+
+
+def _fetch_page(url: str) -> tuple[str | None, dict | None, str | None]:
+    """``fetch_url`` that also returns the response headers.
+
+    Returns ``(html, headers, None)`` or ``(None, None, error)``.
+    """
+    body, headers, err = safe_fetch(url)
     if err:
-        return None, err
+        return None, None, err
     if body is None:
-        return None, f"empty body for {url}"
-    return body.decode("utf-8", errors="replace"), None
+        return None, None, f"empty body for {url}"
+    return body.decode("utf-8", errors="replace"), headers, None
+
+
+def fetch_urls(
+    urls: list[str], max_workers: int = _FETCH_WORKERS
+) -> Iterator[tuple[str | None, dict | None, str | None]]:
+    """Fetch ``urls`` on a thread pool, yielding results in input order.
+
+    Each entry is ``(html, headers, error)`` as from ``_fetch_page``; the
+    headers let callers read ``Last-Modified`` without a second request.
+    Each fetch goes through the same SSRF-safe path as ``fetch_url``;
+    up to ``max_workers`` fetches overlap, so a batch pays about one
+    round trip per ``max_workers`` pages instead of one per page.
+
+    At most ``max_workers`` fetches are in flight or waiting to be
+    consumed: a new one is submitted only as a result is handed out, so
+    a slow consumer bounds how many fetched pages sit in memory.
+    """
+    if max_workers <= 1 or len(urls) <= 1:
+        for u in urls:
+            yield _fetch_page(u)
+        return
+    window = min(max_workers, len(urls))
+    with ThreadPoolExecutor(max_workers=window) as pool:
+        in_flight = deque(pool.submit(_fetch_page, u) for u in urls[:window])
+        remaining = iter(urls[window:])
+        while in_flight:
+            page = in_flight.popleft().result()
+            url = next(remaining, None)
+            if url is not None:
+                in_flight.append(pool.submit(_fetch_page, url))
+            yield page
 
 
 def _http_last_modified(url: str) -> str | None:
@@ -49,7 +97,14 @@ def _http_last_modified(url: str) -> str | None:
     SSRF-safe: same scheme + IP validation as ``fetch_url``.
     """
     _body, headers, err = safe_fetch(url, method="HEAD")
-    if err or not headers:
+    if err:
+        return None
+    return _last_modified_date(headers)
+
+
+def _last_modified_date(headers: dict | None) -> str | None:
+    """ISO date from a response's ``Last-Modified`` header, if parseable."""
+    if not headers:
         return None
     lm = headers.get("Last-Modified")
     if not lm:
@@ -60,13 +115,26 @@ def _http_last_modified(url: str) -> str | None:
         return None
 
 
-def _bs4_preclean(html: str) -> str:
-    soup = BeautifulSoup(html, "lxml")
-    for tag in soup.find_all(
-        ["script", "style", "nav", "header", "footer", "aside", "iframe"]
-    ):
-        tag.decompose()
-    return str(soup)
+# Page chrome dropped before the markdownify fallback. The parser is given
+# UTF-8 bytes with an explicit encoding so in-document charset / XML
+# declarations can't override it (lxml refuses str input that carries an
+# encoding declaration).
+_PRECLEAN_XPATH = etree.XPath(
+    "//script | //style | //nav | //header | //footer | //aside | //iframe"
+)
+_PRECLEAN_PARSER = lxml_html.HTMLParser(encoding="utf-8")
+
+
+def _preclean(html: str) -> str:
+    try:
+        root = lxml_html.document_fromstring(
+            html.encode("utf-8"), parser=_PRECLEAN_PARSER
+        )
+    except etree.ParserError:  # empty / comment-only document
+        return ""
+    for el in _PRECLEAN_XPATH(root):
+        el.drop_tree()  # keeps the element's tail text, like bs4 decompose()
+    return lxml_html.tostring(root, encoding="unicode")
 
 
 def _extract(raw_html: str) -> tuple[str, str]:
@@ -79,7 +147,11 @@ def _extract(raw_html: str) -> tuple[str, str]:
     )
     if md:
         return md, "trafilatura"
-    cleaned = _bs4_preclean(raw_html)
+    # Fallback-only dependency; imported on demand to keep it off the
+    # common trafilatura path.
+    import markdownify
+
+    cleaned = _preclean(raw_html)
     md = markdownify.markdownify(cleaned, heading_style="ATX", strip=["img"])
     return md, "trafilatura+bs4_fallback"
 
@@ -125,7 +197,14 @@ def convert_html(
     strip_links_flag: bool = False,
     source_url: str | None = None,
     html_content: str | None = None,
+    response_headers: dict | None = None,
 ) -> bool:
+    """Convert a local HTML file, or fetched ``html_content``, to Markdown.
+
+    For ``source_url`` inputs, ``response_headers`` are the headers of the
+    GET that produced ``html_content``; when given, the ``Last-Modified``
+    date fallback is read from them instead of sending a HEAD request.
+    """
     if options is None:
         options = PipelineOptions(strip_links=strip_links_flag)
 
@@ -169,7 +248,10 @@ def convert_html(
         title_hint, authors, org, doc_date, keywords = _extract_metadata(raw_html)
 
         if source_url and not doc_date:
-            doc_date = _http_last_modified(source_url)
+            if response_headers is not None:
+                doc_date = _last_modified_date(response_headers)
+            else:
+                doc_date = _http_last_modified(source_url)
         if not doc_date:
             doc_date = date.today().isoformat()
 
@@ -183,17 +265,19 @@ def convert_html(
             date=doc_date,
             keywords=keywords,
             pages=None,
-            word_count=len(md_text.split()),
+            word_count=count_words(md_text),
             source_file=html_path.name if html_path else None,
             source_url=source_url,
             doc_type="html",
             extracted_via=extracted_via,
             lane="text",
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        parts = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, parts)
         wc = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
@@ -213,14 +297,51 @@ def convert_url(
     strip_links_flag: bool = False,
 ) -> bool:
     """Convenience wrapper: fetch a URL and convert to Markdown."""
+    url = _scrub_url(url)
+    return _convert_fetched(
+        url, _fetch_page(url), output_dir, options, force, strip_links_flag
+    )
+
+
+def convert_urls(
+    urls: list[str],
+    output_dir: Path,
+    options: PipelineOptions | None = None,
+    force: bool = False,
+    max_workers: int = _FETCH_WORKERS,
+) -> Iterator[tuple[str, bool]]:
+    """Fetch ``urls`` concurrently and convert each page in input order.
+
+    Yields ``(url, ok)`` per input URL. Each page is converted as soon as
+    it and every page before it have arrived, overlapping conversion with
+    the remaining fetches; conversion and its console output stay
+    sequential.
+    """
+    scrubbed = [_scrub_url(u) for u in urls]
+    fetched = fetch_urls(scrubbed, max_workers=max_workers)
+    for orig, url, page in zip(urls, scrubbed, fetched):
+        yield orig, _convert_fetched(url, page, output_dir, options, force)
+
+
+def _scrub_url(url: str) -> str:
     scrubbed_url, warnings = scrub_url_credentials(url)
     for w in warnings:
         if w == "credentials":
             _logging.warn("stripped credentials from URL")
         else:
             _logging.warn(f"stripped sensitive query parameter '{w}' from URL")
-    url = scrubbed_url
-    html_content, err = fetch_url(url)
+    return scrubbed_url
+
+
+def _convert_fetched(
+    url: str,
+    page: tuple[str | None, dict | None, str | None],
+    output_dir: Path,
+    options: PipelineOptions | None,
+    force: bool,
+    strip_links_flag: bool = False,
+) -> bool:
+    html_content, headers, err = page
     if err:
         _logging.fail(f"{url} -- {err}")
         return False
@@ -232,4 +353,5 @@ def convert_url(
         strip_links_flag=strip_links_flag,
         source_url=url,
         html_content=html_content,
+        response_headers=headers,
     )
@@ -16,12 +16,11 @@ from datetime import date
 from pathlib import Path
 
 import pymupdf
-import pymupdf4llm
 
-from any2md import _logging, pipeline
+from any2md import _extract_cache, _logging, pipeline
 from any2md._docling import has_docling, install_hint
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.heuristics import filter_organization
 from any2md.pipeline import PipelineOptions
 from any2md.utils import atomic_write_text, safe_dir_name, sanitize_filename
@@ -98,39 +97,47 @@ def pdf_looks_complex(pdf_path: Path) -> bool:
     """
     try:
         with pymupdf.open(str(pdf_path)) as doc:
-            page_count = len(doc)
-            if page_count <= 5:
-                return False
+            return _doc_looks_complex(doc)
+    except (OSError, ValueError, RuntimeError):
+        return False
 
-            sample_idxs = (
-                list(range(page_count))
-                if page_count <= 5
-                else [int(i * page_count / 5) for i in range(5)]
-            )
 
-            total_chars = 0
-            multi_column_seen = False
-            for idx in sample_idxs:
-                page = doc[idx]
-                text = page.get_text("text") or ""
-                total_chars += len(text)
-                # Multi-column heuristic: collect block x-positions; if there
-                # are clusters around two distinct x ranges with > 100 px
-                # separation, flag.
-                blocks = page.get_text("blocks") or []
-                xs = sorted({round(b[0], 0) for b in blocks if len(b) >= 4})
-                if len(xs) >= 4:
-                    # Check if there's a gap > page_width * 0.2 between
-                    # consecutive x-starts.
-                    pw = page.rect.width or 612
-                    for a, b in zip(xs, xs[1:]):
-                        if b - a > pw * 0.2:
-                            multi_column_seen = True
-                            break
-
-            avg_chars = total_chars / max(len(sample_idxs), 1)
-            scanned_signal = avg_chars < 200
-            return multi_column_seen or scanned_signal
+def _doc_looks_complex(doc: "pymupdf.Document") -> bool:
+    """:func:`pdf_looks_complex` on an already-open document."""
+    try:
+        page_count = len(doc)
+        if page_count <= 5:
+            return False
+
+        sample_idxs = (
+            list(range(page_count))
+            if page_count <= 5
+            else [int(i * page_count / 5) for i in range(5)]
+        )
+
+        total_chars = 0
+        multi_column_seen = False
+        for idx in sample_idxs:
+            page = doc[idx]
+            text = page.get_text("text") or ""
+            total_chars += len(text)
+            # Multi-column heuristic: collect block x-positions; if there
+            # are clusters around two distinct x ranges with > 100 px
+            # separation, flag.
+            blocks = page.get_text("blocks") or []
+            xs = sorted({round(b[0], 0) for b in blocks if len(b) >= 4})
+            if len(xs) >= 4:
+                # Check if there's a gap > page_width * 0.2 between
+                # consecutive x-starts.
+                pw = page.rect.width or 612
+                for a, b in zip(xs, xs[1:]):
+                    if b - a > pw * 0.2:
+                        multi_column_seen = True
+                        break
+
+        avg_chars = total_chars / max(len(sample_idxs), 1)
+        scanned_signal = avg_chars < 200
+        return multi_column_seen or scanned_signal
     except (OSError, ValueError, RuntimeError):
         return False
 
@@ -188,6 +195,8 @@ def _extract_via_docling(
 
 
 def _extract_via_pymupdf4llm(doc: "pymupdf.Document") -> tuple[str, str]:
+    import pymupdf4llm
+
     md = pymupdf4llm.to_markdown(
         doc,
         write_images=False,
@@ -238,36 +247,69 @@ def convert_pdf(
         else:
             use_docling = has_docling()
 
-        if not use_docling and options.backend is None and pdf_looks_complex(pdf_path):
-            install_hint()
+        # Cached extraction (--cache). Bypassed under --save-images, whose
+        # image files are a side effect of running Docling.
+        cache_key = None
+        cached = None
+        if options.extraction_cache and not options.save_images:
+            backend = "docling" if use_docling else "pymupdf4llm"
+            # pymupdf4llm output also depends on the MuPDF engine shipped
+            # with pymupdf, which can be upgraded independently.
+            dists = (backend,) if use_docling else (backend, "pymupdf")
+            tag = ":".join(
+                [
+                    "pdf",
+                    backend,
+                    *(_extract_cache.backend_version(d) for d in dists),
+                    f"ocr={options.ocr_figures}",
+                ]
+            )
+            cache_key = _extract_cache.cache_key(pdf_path, tag)
+            cached = _extract_cache.load(output_dir, cache_key)
 
-        # Always extract metadata via PyMuPDF — independent of which
+        # One open document serves metadata, the complexity heuristic and
+        # pymupdf4llm (which accepts a Document), so the PDF is parsed
+        # once. Metadata always comes from PyMuPDF, independent of which
         # backend produces the markdown body.
         with pymupdf.open(str(pdf_path)) as doc:
             page_count = len(doc)
             props = _parse_pdf_metadata(doc)
-            fallback_md = None
-            if not use_docling:
-                fallback_md, extracted_via = _extract_via_pymupdf4llm(doc)
-                lane = "text"
 
-        if use_docling:
-            try:
-                md_text, extracted_via = _extract_via_docling(
-                    pdf_path, options, output_dir
-                )
-                lane = "structured"
-            except Exception as e:  # noqa: BLE001 — fall back rather than fail
-                print(
-                    f"  WARN: Docling extraction failed for {pdf_path.name}: {e}; "
-                    f"falling back to pymupdf4llm.",
-                    file=sys.stderr,
+            if not use_docling and options.backend is None and _doc_looks_complex(doc):
+                install_hint()
+
+            if cached is not None:
+                md_text, extracted_via, lane = (
+                    cached.markdown,
+                    cached.extracted_via,
+                    cached.lane,
                 )
-                with pymupdf.open(str(pdf_path)) as doc:
+            elif use_docling:
+                try:
+                    md_text, extracted_via = _extract_via_docling(
+                        pdf_path, options, output_dir
+                    )
+                    lane = "structured"
+                except Exception as e:  # noqa: BLE001 — fall back rather than fail
+                    print(
+                        f"  WARN: Docling extraction failed for {pdf_path.name}: {e}; "
+                        f"falling back to pymupdf4llm.",
+                        file=sys.stderr,
+                    )
                     md_text, extracted_via = _extract_via_pymupdf4llm(doc)
+                    lane = "text"
+                    # Don't pin a possibly transient Docling failure in the cache.
+                    cache_key = None
+            else:
+                md_text, extracted_via = _extract_via_pymupdf4llm(doc)
                 lane = "text"
-        else:
-            md_text = fallback_md
+
+        if cache_key is not None and cached is None:
+            _extract_cache.store(
+                output_dir,
+                cache_key,
+                _extract_cache.CachedExtraction(md_text, extracted_via, lane),
+            )
 
         md_text, warnings = pipeline.run(md_text, lane, options)
         add_warnings(warnings)
@@ -290,10 +332,12 @@ def convert_pdf(
             lane=lane,
             produced_by=props["produced_by"],
         )
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        parts = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, parts)
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
             print(f"  OK: {out_name} ({page_count} pages, via {extracted_via}{suffix})")
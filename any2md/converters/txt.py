@@ -8,9 +8,14 @@ from pathlib import Path
 
 from any2md import _logging, pipeline
 from any2md.converters import add_warnings, is_quiet
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose_parts
 from any2md.pipeline import PipelineOptions
-from any2md.utils import atomic_write_text, read_text_with_fallback, sanitize_filename
+from any2md.utils import (
+    atomic_write_text,
+    count_words,
+    read_text_with_fallback,
+    sanitize_filename,
+)
 
 # Existing structurize() heuristic stays in this file from v0.7 — keep it.
 _SEPARATOR_RE = re.compile(r"^([=\-*_~])\1{2,}\s*$")
@@ -159,7 +164,7 @@ def _build_meta(txt_path: Path, body: str) -> SourceMeta:
         ),
         keywords=[],
         pages=None,
-        word_count=len(body.split()),
+        word_count=count_words(body),
         source_file=txt_path.name,
         source_url=None,
         doc_type="txt",
@@ -195,10 +200,12 @@ def convert_txt(
         md_text, warnings = pipeline.run(md_text, "text", options)
         add_warnings(warnings)
         meta = _build_meta(txt_path, md_text)
-        full = compose(md_text, meta, options, overrides=options.frontmatter_overrides)
+        parts = compose_parts(
+            md_text, meta, options, overrides=options.frontmatter_overrides
+        )
 
         output_dir.mkdir(parents=True, exist_ok=True)
-        atomic_write_text(out_path, full)
+        atomic_write_text(out_path, parts)
         word_count = meta.word_count or 0
         suffix = f", {len(warnings)} warning(s)" if warnings else ""
         if not is_quiet():
@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import html
 import re
+from collections.abc import Iterator
 from typing import NamedTuple
 
 from any2md import _logging
@@ -125,6 +126,16 @@ _ARXIV_FILENAME_RE = re.compile(
     r"(?<!\d)(\d{4}\.\d{4,5})(?:v\d+)?(?=\.pdf$|\.|$)",
     re.IGNORECASE,
 )
+# arxiv ID at the end of a basename, or anywhere when not followed by a
+# digit/dot (see is_arxiv_filename).
+_ARXIV_ID_TAIL_RE = re.compile(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?$")
+_ARXIV_ID_ANYWHERE_RE = re.compile(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?(?![0-9.])")
+
+# Generic whitespace / separator helpers
+_WS_RUN_RE = re.compile(r"\s+")
+_PARA_SPLIT_RE = re.compile(r"\n\s*\n")
+_AND_SEPARATOR_RE = re.compile(r"\s+and\s+", re.IGNORECASE)
+_NON_WORD_RE = re.compile(r"[^\w\s]")
 
 
 class OrgFilterResult(NamedTuple):
@@ -256,11 +267,12 @@ def _is_skip_paragraph(para: str) -> bool:
 def _cleanup_abstract(text: str) -> str:
     """Apply post-selection cleanup: strip links, decode entities, truncate."""
     # Strip markdown links: [text](url) → text
-    text = _MD_LINK_RE.sub(r"\1", text)
+    if "](" in text:
+        text = _MD_LINK_RE.sub(r"\1", text)
     # Decode HTML entities
     text = html.unescape(text)
     # Collapse whitespace runs
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _WS_RUN_RE.sub(" ", text).strip()
     # Truncate to <= 400 chars at last sentence boundary
     if len(text) > 400:
         head = text[:400]
@@ -275,18 +287,30 @@ def _cleanup_abstract(text: str) -> str:
     return text
 
 
-def _split_body_paragraphs(body: str) -> list[str]:
-    """Split body into paragraphs (blank-line separated, headings excluded)."""
-    paras: list[str] = []
-    for chunk in re.split(r"\n\s*\n", body):
+def iter_paragraphs(text: str) -> Iterator[str]:
+    """Lazily yield the blank-line-separated chunks of ``text``.
+
+    Same pieces as ``_PARA_SPLIT_RE.split(text)``, one at a time, so an
+    early-exit scan over a large body stops splitting once it has its
+    answer instead of materializing every paragraph up front.
+    """
+    start = 0
+    for m in _PARA_SPLIT_RE.finditer(text):
+        yield text[start : m.start()]
+        start = m.end()
+    yield text[start:]
+
+
+def _iter_body_paragraphs(body: str) -> Iterator[str]:
+    """Yield body paragraphs (blank-line separated, headings excluded)."""
+    for chunk in iter_paragraphs(body):
         line = chunk.strip()
         if not line:
             continue
         # Skip heading lines
         if line.startswith("#"):
             continue
-        paras.append(line)
-    return paras
+        yield line
 
 
 def refine_abstract(
@@ -326,7 +350,7 @@ def refine_abstract(
     if m:
         rest = body[m.end() :]
         # Take first non-empty paragraph until next heading or blank-line gap.
-        for para in _split_body_paragraphs(rest):
+        for para in _iter_body_paragraphs(rest):
             if len(para) >= 80 and not _is_skip_paragraph(para):
                 return _cleanup_abstract(para)
 
@@ -335,7 +359,7 @@ def refine_abstract(
         return _cleanup_abstract(candidate)
 
     # Candidate skipped or missing. Walk body paragraphs.
-    for para in _split_body_paragraphs(body):
+    for para in _iter_body_paragraphs(body):
         # Skip the candidate itself if it appears verbatim in body.
         if candidate and para.strip() == candidate.strip():
             continue
@@ -359,7 +383,7 @@ def _normalize_author_name(name: str) -> str:
     """Title-case a name and strip stray digits/whitespace."""
     # Strip affiliation digits (trailing or interleaved)
     cleaned = _AFFIL_DIGITS_RE.sub("", name)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip(" ,.")
+    cleaned = _WS_RUN_RE.sub(" ", cleaned).strip(" ,.")
     if not cleaned:
         return ""
     # Title-case if currently all-caps; else preserve.
@@ -371,7 +395,7 @@ def _normalize_author_name(name: str) -> str:
 def _split_authors(text: str) -> list[str]:
     """Split a comma/and-separated author list into individual names."""
     # Replace " and " with comma to unify separators
-    text = re.sub(r"\s+and\s+", ", ", text, flags=re.IGNORECASE)
+    text = _AND_SEPARATOR_RE.sub(", ", text)
     parts = [p.strip() for p in text.split(",")]
     # Filter empties and pure-digit affiliation tokens
     return [p for p in parts if p and not p.strip().isdigit()]
@@ -382,8 +406,8 @@ def _dedupe_authors(authors: list[str]) -> list[str]:
     seen: set[str] = set()
     out: list[str] = []
     for a in authors:
-        key = re.sub(r"\s+", " ", a.strip().lower())
-        key = re.sub(r"[^\w\s]", "", key)
+        key = _WS_RUN_RE.sub(" ", a.strip().lower())
+        key = _NON_WORD_RE.sub("", key)
         if not key or key in seen:
             continue
         seen.add(key)
@@ -500,12 +524,12 @@ def is_arxiv_filename(name: str) -> str | None:
     # ("AI_Governance_through_Markets-2501.17755v1.pdf"), or trailing.
     # The negative-lookbehind (?<![0-9.]) prevents matching a number
     # embedded in a longer numeric sequence.
-    m = re.search(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?$", base_no_ext)
+    m = _ARXIV_ID_TAIL_RE.search(base_no_ext)
     if m:
         return m.group(1)
     # Also accept the arxiv ID anywhere in the basename when followed by
     # a non-digit/non-dot or end-of-string.
-    m = re.search(r"(?<![0-9.])(\d{4}\.\d{4,5})(?:v\d+)?(?![0-9.])", base_no_ext)
+    m = _ARXIV_ID_ANYWHERE_RE.search(base_no_ext)
     if m:
         return m.group(1)
     return None
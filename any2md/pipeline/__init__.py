@@ -58,6 +58,12 @@ class PipelineOptions:
     # ``--no-docx-fallback-on-warn`` to keep Docling output even when
     # warnings fire (e.g. when comparing backends explicitly).
     docx_fallback_on_warn: bool = True
+    # When True, PDF/DOCX backend extraction output is cached under
+    # ``<output_dir>/.cache/`` keyed on the input's SHA-256, so re-runs
+    # over unchanged inputs skip Docling / pymupdf4llm / mammoth. The
+    # pipeline and frontmatter still run on every conversion. See
+    # ``any2md/_extract_cache.py``. Enabled via ``--cache``.
+    extraction_cache: bool = False
 
 
 Stage = Callable[[str, PipelineOptions], str]
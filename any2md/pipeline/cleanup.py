@@ -66,16 +66,33 @@ def normalize_quotes_dashes(text: str, _options: "PipelineOptions") -> str:
 
 
 _INTERWORD_RUNS_RE = re.compile(r"(?<=\S)[ \t]{2,}(?=\S)")
-_TRAILING_WS_RE = re.compile(r"[ \t]+$", re.MULTILINE)
-_BLANK_RUN_RE = re.compile(r"\n{3,}")
 
 
 def collapse_whitespace(text: str, _options: "PipelineOptions") -> str:
-    """C5: Collapse inter-word whitespace; trim trailing per line; cap blanks at 2."""
+    """C5: Collapse inter-word whitespace; trim trailing per line; cap blanks at 2.
+
+    Trailing-whitespace trim and blank-run capping share a single pass over
+    the lines: any run of 3+ newlines (whitespace-only lines count as
+    empty) becomes exactly two.
+    """
     text = _INTERWORD_RUNS_RE.sub(" ", text)
-    text = _TRAILING_WS_RE.sub("", text)
-    text = _BLANK_RUN_RE.sub("\n\n", text)
-    return text
+    out: list[str] = []
+    blanks = 0  # empty lines seen since the last non-empty one
+    for line in text.split("\n"):
+        line = line.rstrip(" \t")
+        if not line:
+            blanks += 1
+            continue
+        if blanks:
+            # n blank lines are n + 1 newlines between two content lines
+            # but only n newlines before the first one.
+            out.extend([""] * min(blanks, 1 if out else 2))
+            blanks = 0
+        out.append(line)
+    if blanks:
+        # Trailing run: n newlines after content, n - 1 if there is none.
+        out.extend([""] * min(blanks, 2 if out else 3))
+    return "\n".join(out)
 
 
 _FENCE_RE = re.compile(r"^```")
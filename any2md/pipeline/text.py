@@ -82,6 +82,7 @@ def repair_line_wraps(text: str, _options: "PipelineOptions") -> str:
 
 
 _HYPHEN_WRAP_RE = re.compile(r"([a-z]+)-\n([a-z]+)")
+_LOWER_WORD_RE = re.compile(r"\b[a-z]+\b")
 
 
 def dehyphenate(text: str, _options: "PipelineOptions") -> str:
@@ -97,7 +98,7 @@ def dehyphenate(text: str, _options: "PipelineOptions") -> str:
         return text
 
     # Build set of words that appear in the text (lowercase, alphanumeric)
-    words_in_doc = set(re.findall(r"\b[a-z]+\b", text.lower()))
+    words_in_doc = set(_LOWER_WORD_RE.findall(text.lower()))
 
     def _replace(match: re.Match[str]) -> str:
         prefix_word = match.group(1)
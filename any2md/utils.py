@@ -10,11 +10,20 @@ import os
 import re
 import tempfile
 import urllib.parse
+from collections.abc import Sequence
 from pathlib import Path
 
-_CTRL_CHARS_RE = re.compile(r"[\x00-\x1f\x7f]")
-_SPECIAL_CHARS_RE = re.compile(r"[,;:'\"—–]")
+# One-pass filename filter: drop control chars, path separators, and
+# the ,;:'"—– punctuation set; spaces become underscores. Both tables
+# derive from the same ASCII delete set: the str table (which also drops
+# the non-ASCII dashes) serves any stem, the bytes pair is the faster
+# path for all-ASCII stems.
+_FILENAME_ASCII_DELETE = "".join(map(chr, range(0x20))) + "\x7f/\\,;:'\""
+_FILENAME_TABLE = str.maketrans(" ", "_", _FILENAME_ASCII_DELETE + "—–")
+_FILENAME_BYTES_TABLE = bytes.maketrans(b" ", b"_")
+_FILENAME_BYTES_DELETE = _FILENAME_ASCII_DELETE.encode("ascii")
 _COLLAPSE_UNDERSCORES_RE = re.compile(r"_+")
+_NON_DIR_NAME_CHARS_RE = re.compile(r"[^A-Za-z0-9_-]")
 _LINK_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
 
 
@@ -25,10 +34,14 @@ def sanitize_filename(name: str) -> str:
     Matches existing convention: spaces -> underscores, extension -> .md.
     """
     stem = Path(name).stem
-    stem = _CTRL_CHARS_RE.sub("", stem)
-    stem = stem.replace("/", "").replace("\\", "")
-    stem = stem.replace(" ", "_")
-    stem = _SPECIAL_CHARS_RE.sub("", stem)
+    if stem.isascii():
+        stem = (
+            stem.encode("ascii")
+            .translate(_FILENAME_BYTES_TABLE, _FILENAME_BYTES_DELETE)
+            .decode("ascii")
+        )
+    else:
+        stem = stem.translate(_FILENAME_TABLE)
     stem = _COLLAPSE_UNDERSCORES_RE.sub("_", stem)
     stem = stem.strip("_")
     if not stem:
@@ -42,12 +55,62 @@ def strip_links(text: str) -> str:
     Converts ``[text](url)`` to ``text``. Used by --strip-links CLI flag
     (removed in Phase 4 once gating moves to the pipeline).
     """
+    # Every link contains "](", and a substring test is far cheaper than
+    # running the regex over a link-free document.
+    if "](" not in text:
+        return text
     return _LINK_RE.sub(r"\1", text)
 
 
-def atomic_write_text(out_path: Path, content: str) -> None:
+_WORD_COUNT_CHUNK = 1 << 16
+
+
+def count_words(text: str) -> int:
+    """Return ``len(text.split())`` without materializing every word at once.
+
+    Splits fixed-size slices so peak memory is bounded by the slice rather
+    than the document; a word cut by a slice boundary is counted once.
+    """
+    count = 0
+    tail_in_word = False
+    for start in range(0, len(text), _WORD_COUNT_CHUNK):
+        chunk = text[start : start + _WORD_COUNT_CHUNK]
+        count += len(chunk.split())
+        if tail_in_word and not chunk[0].isspace():
+            count -= 1
+        tail_in_word = not chunk[-1].isspace()
+    return count
+
+
+def _write_all(fd: int, chunks: list[bytes]) -> None:
+    """Write every byte of ``chunks`` to ``fd``, resuming after short writes.
+
+    Uses a single gather ``os.writev`` where available (POSIX); falls back
+    to one ``os.write`` per chunk elsewhere.
+    """
+    views = [memoryview(c) for c in chunks if c]
+    while views:
+        if hasattr(os, "writev"):
+            written = os.writev(fd, views)
+        else:
+            written = os.write(fd, views[0])
+        while written:
+            if written >= len(views[0]):
+                written -= len(views[0])
+                views.pop(0)
+            else:
+                views[0] = views[0][written:]
+                written = 0
+
+
+def atomic_write_text(out_path: Path, content: str | Sequence[str]) -> None:
     """Write text atomically; refuse to clobber a symlink target.
 
+    ``content`` may be a single string or a sequence of strings written
+    back to back (e.g. frontmatter and body), which spares the caller a
+    full-document concatenation. Parts are UTF-8 encoded and written to
+    the raw temp-file descriptor; no newline translation is applied.
+
     Defends against the symlink-redirect attack at the output path with
     a tight TOCTOU window: ``os.lstat`` runs immediately before
     ``os.replace`` so the check-and-replace race shrinks to a single
@@ -56,16 +119,18 @@ def atomic_write_text(out_path: Path, content: str) -> None:
     """
     if out_path.is_symlink():
         raise ValueError(f"refusing to write through symlink: {out_path}")
+    parts = (content,) if isinstance(content, str) else content
     out_path.parent.mkdir(parents=True, exist_ok=True)
     fd, tmp_str = tempfile.mkstemp(
         prefix=".any2md-", suffix=".tmp", dir=out_path.parent
     )
     tmp_path = Path(tmp_str)
     try:
-        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as f:
-            f.write(content)
-            f.flush()
-            os.fsync(f.fileno())
+        try:
+            _write_all(fd, [part.encode("utf-8") for part in parts])
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         # Tight re-check immediately before replace
         try:
             st = os.lstat(out_path)
@@ -80,6 +145,17 @@ def atomic_write_text(out_path: Path, content: str) -> None:
         raise
 
 
+def read_file_bytes(path: Path) -> bytes:
+    """Read ``path`` whole with unbuffered I/O.
+
+    ``FileIO.readall`` sizes one buffer from ``fstat`` and fills it with
+    direct ``read`` calls, so the bytes never pass through a
+    ``BufferedReader``.
+    """
+    with open(path, "rb", buffering=0) as f:
+        return f.readall()
+
+
 def read_text_with_fallback(path: Path) -> str:
     """Read a text file, trying utf-8 first then falling back to latin-1."""
     try:
@@ -96,7 +172,7 @@ def safe_dir_name(name: str) -> str:
     collapses runs of ``_``, strips leading/trailing ``_``, and falls
     back to ``"untitled"`` for empty results.
     """
-    cleaned = re.sub(r"[^A-Za-z0-9_-]", "_", name)
+    cleaned = _NON_DIR_NAME_CHARS_RE.sub("_", name)
     cleaned = _COLLAPSE_UNDERSCORES_RE.sub("_", cleaned)
     cleaned = cleaned.strip("_") or "untitled"
     return cleaned
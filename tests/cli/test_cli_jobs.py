@@ -0,0 +1,97 @@
+"""CLI behavior for --jobs (process-pool batch conversion)."""
+
+from __future__ import annotations
+
+import os
+import re
+import shutil
+import subprocess
+import sys
+
+
+def _run(*args, env=None):
+    return subprocess.run(
+        [sys.executable, "-m", "any2md", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+
+
+def test_jobs_in_help():
+    r = _run("--help")
+    assert r.returncode == 0
+    assert "--jobs" in r.stdout
+
+
+def test_jobs_negative_rejected():
+    r = _run("--jobs", "-1")
+    assert r.returncode != 0
+    assert "--jobs" in r.stderr
+
+
+def test_jobs_parallel_matches_sequential(fixture_dir, tmp_path):
+    """--jobs 2 converts every file and produces the same bytes as --jobs 1."""
+    src = tmp_path / "src"
+    src.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        shutil.copy(fixture_dir / "ligatures_and_softhyphens.txt", src / name)
+
+    seq, par = tmp_path / "seq", tmp_path / "par"
+    r1 = _run("-o", str(seq), "-i", str(src))
+    r2 = _run("-o", str(par), "-i", str(src), "--jobs", "2")
+    assert r1.returncode == 0, r1.stderr
+    assert r2.returncode == 0, r2.stderr
+    assert "3 converted" in r2.stdout
+    assert r2.stdout.count("OK:") == 3
+    for name in ("a.md", "b.md", "c.md"):
+        assert (par / name).read_bytes() == (seq / name).read_bytes()
+
+
+def test_jobs_forwards_worker_warnings_to_strict(fixture_dir, tmp_path):
+    """Warnings raised inside workers still drive the --strict exit code."""
+    no_h1 = tmp_path / "no_h1.txt"
+    no_h1.write_text("just a plain sentence with no heading.\n")
+    r = _run(
+        "--strict",
+        "--jobs",
+        "2",
+        "-o",
+        str(tmp_path / "out"),
+        str(no_h1),
+        str(fixture_dir / "ligatures_and_softhyphens.txt"),
+    )
+    assert r.returncode == 3, f"stdout={r.stdout!r} stderr={r.stderr!r}"
+    assert "1 warning(s)" in r.stdout
+
+
+def test_jobs_worker_output_lines_stay_whole_unbuffered(tmp_path):
+    """Unbuffered worker prints must not interleave on the shared stdout."""
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(24):
+        (src / f"f{i}.txt").write_text(f"# T{i}\n\nsome words here\n")
+    env = {**os.environ, "PYTHONUNBUFFERED": "1"}
+    r = _run("-o", str(tmp_path / "out"), "-i", str(src), "--jobs", "4", env=env)
+    assert r.returncode == 0, r.stderr
+    ok_lines = [ln for ln in r.stdout.splitlines() if "OK:" in ln]
+    assert len(ok_lines) == 24
+    assert all(re.fullmatch(r"  OK: f\d+\.md \(\d+ words\)", ln) for ln in ok_lines)
+
+
+def test_jobs_same_output_name_keeps_sequential_winner(tmp_path):
+    """Under --force, inputs sharing an output name run in order; the last wins."""
+    src = tmp_path / "src"
+    src.mkdir()
+    html = src / "a.html"
+    html.write_text(
+        "<html><body><article>"
+        + "<p>HTML version of the document body.</p>" * 50
+        + "</article></body></html>"
+    )
+    txt = src / "a.txt"
+    txt.write_text("# Text version\n\nplain text body\n")
+    out = tmp_path / "out"
+    r = _run("--force", "--jobs", "2", "-o", str(out), str(html), str(txt))
+    assert r.returncode == 0, r.stderr
+    assert "Text version" in (out / "a.md").read_text(encoding="utf-8")
@@ -0,0 +1,18 @@
+"""CLI startup must not pull in converter backends it doesn't need."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def test_cli_import_skips_converter_backends():
+    probe = (
+        "import sys, any2md.cli\n"
+        "heavy = ('trafilatura', 'markdownify', 'mammoth', 'pymupdf4llm')\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    r = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    )
+    assert r.stdout.strip() == ""
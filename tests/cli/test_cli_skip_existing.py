@@ -0,0 +1,70 @@
+"""CLI behavior for skipping inputs whose output already exists."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+# Runs the CLI with the page fetch stubbed out, so URL inputs convert
+# without network access. Each stubbed fetch is logged to stderr.
+_OFFLINE_MAIN = """
+import sys
+import any2md.converters.html as html_mod
+page = "<html><body><article>" + "<p>Offline page body text.</p>" * 20
+page += "</article></body></html>"
+def _fetch_page(url):
+    sys.stderr.write(f"FETCH {url}\\n")
+    return page, {}, None
+html_mod._fetch_page = _fetch_page
+from any2md.cli import main
+sys.argv = ["any2md", *sys.argv[1:]]
+main()
+"""
+
+_URL = "https://example.com/page"  # -> example_com_page.md
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, "-c", _OFFLINE_MAIN, *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_rerun_without_force_skips_everything(tmp_path):
+    src = tmp_path / "notes.txt"
+    src.write_text("# Notes\n\nSome text.\n", encoding="utf-8")
+    out = tmp_path / "out"
+
+    r1 = _run("-o", str(out), str(src), _URL)
+    assert r1.returncode == 0, r1.stderr
+    assert "2 converted, 0 skipped" in r1.stdout
+
+    r2 = _run("-o", str(out), str(src), _URL)
+    assert r2.returncode == 0, r2.stderr
+    assert r2.stdout.count("SKIP (exists)") == 2
+    assert "0 converted, 2 skipped" in r2.stdout
+
+
+def test_local_file_colliding_with_url_output_is_skipped(tmp_path):
+    # The URL pass runs first and writes example_com_page.md; the local
+    # file sanitizes to the same name and must see it as existing.
+    src = tmp_path / "example_com_page.txt"
+    src.write_text("# Local\n\nSome text.\n", encoding="utf-8")
+    out = tmp_path / "out"
+
+    r = _run("-o", str(out), _URL, str(src))
+    assert r.returncode == 0, r.stderr
+    assert "SKIP (exists): example_com_page.md" in r.stdout
+    assert "1 converted, 1 skipped" in r.stdout
+    assert "Local" not in (out / "example_com_page.md").read_text(encoding="utf-8")
+
+
+def test_urls_sharing_output_name_fetch_once(tmp_path):
+    out = tmp_path / "out"
+    r = _run("-o", str(out), f"{_URL}?p=1", f"{_URL}?p=2")
+    assert r.returncode == 0, r.stderr
+    assert r.stderr.count("FETCH ") == 1
+    assert "SKIP (exists): example_com_page.md" in r.stdout
+    assert "1 converted, 1 skipped" in r.stdout
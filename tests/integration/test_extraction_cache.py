@@ -0,0 +1,66 @@
+"""Integration test: --cache reuses backend extraction across runs."""
+
+from __future__ import annotations
+
+from any2md.converters import docx as docx_mod
+from any2md.converters import pdf as pdf_mod
+from any2md.pipeline import PipelineOptions
+
+
+def test_docx_cache_hit_skips_mammoth(fixture_dir, tmp_output_dir, monkeypatch):
+    monkeypatch.setattr(docx_mod, "has_docling", lambda: False)
+    options = PipelineOptions(extraction_cache=True)
+    src = fixture_dir / "table_heavy.docx"
+
+    assert docx_mod.convert_docx(src, tmp_output_dir, options=options, force=True)
+    first = (tmp_output_dir / "table_heavy.md").read_text(encoding="utf-8")
+    assert len(list((tmp_output_dir / ".cache").glob("*.json"))) == 1
+
+    def _boom(*_a, **_k):
+        raise AssertionError("mammoth should not run on a cache hit")
+
+    monkeypatch.setattr(docx_mod, "_extract_via_mammoth", _boom)
+    assert docx_mod.convert_docx(src, tmp_output_dir, options=options, force=True)
+    assert (tmp_output_dir / "table_heavy.md").read_text(encoding="utf-8") == first
+
+
+def test_docx_cache_disabled_by_default(fixture_dir, tmp_output_dir, monkeypatch):
+    monkeypatch.setattr(docx_mod, "has_docling", lambda: False)
+    assert docx_mod.convert_docx(
+        fixture_dir / "table_heavy.docx", tmp_output_dir, force=True
+    )
+    assert not (tmp_output_dir / ".cache").exists()
+
+
+def test_pdf_cache_hit_skips_pymupdf4llm(fixture_dir, tmp_output_dir, monkeypatch):
+    monkeypatch.setattr(pdf_mod, "has_docling", lambda: False)
+    options = PipelineOptions(extraction_cache=True)
+    src = fixture_dir / "multi_column.pdf"
+
+    assert pdf_mod.convert_pdf(src, tmp_output_dir, options=options, force=True)
+    first = (tmp_output_dir / "multi_column.md").read_text(encoding="utf-8")
+
+    def _boom(*_a, **_k):
+        raise AssertionError("pymupdf4llm should not run on a cache hit")
+
+    monkeypatch.setattr(pdf_mod, "_extract_via_pymupdf4llm", _boom)
+    assert pdf_mod.convert_pdf(src, tmp_output_dir, options=options, force=True)
+    assert (tmp_output_dir / "multi_column.md").read_text(encoding="utf-8") == first
+
+
+def test_pdf_cache_misses_after_pymupdf_upgrade(
+    fixture_dir, tmp_output_dir, monkeypatch
+):
+    monkeypatch.setattr(pdf_mod, "has_docling", lambda: False)
+    options = PipelineOptions(extraction_cache=True)
+    src = fixture_dir / "multi_column.pdf"
+    assert pdf_mod.convert_pdf(src, tmp_output_dir, options=options, force=True)
+
+    real_version = pdf_mod._extract_cache.backend_version
+    monkeypatch.setattr(
+        pdf_mod._extract_cache,
+        "backend_version",
+        lambda dist: "99.0" if dist == "pymupdf" else real_version(dist),
+    )
+    assert pdf_mod.convert_pdf(src, tmp_output_dir, options=options, force=True)
+    assert len(list((tmp_output_dir / ".cache").glob("*.json"))) == 2
@@ -1,6 +1,8 @@
 """Integration test: HTML converter end-to-end."""
 
 import socket
+import threading
+import time
 import urllib.error
 from email.message import Message
 from io import BytesIO
@@ -103,3 +105,122 @@ def test_fetch_url_rejects_file_scheme(monkeypatch):
 def test_http_last_modified_validates_host(monkeypatch):
     _stub_dns(monkeypatch, {"meta.example": "169.254.169.254"})
     assert html_mod._http_last_modified("http://meta.example/") is None
+
+
+def test_preclean_drops_page_chrome_keeps_tail_text():
+    cleaned = html_mod._preclean(
+        "<html><body><nav>menu</nav><p>keep<script>x()</script> tail</p>"
+        "<footer>foot</footer></body></html>"
+    )
+    assert "menu" not in cleaned
+    assert "x()" not in cleaned
+    assert "foot" not in cleaned
+    assert "keep tail" in cleaned
+
+
+def test_preclean_handles_empty_and_declared_encoding():
+    assert html_mod._preclean("") == ""
+    cleaned = html_mod._preclean(
+        '<?xml version="1.0" encoding="iso-8859-1"?><html><body><p>café</p></body></html>'
+    )
+    assert "café" in cleaned
+
+
+def test_fetch_urls_overlaps_and_keeps_order(monkeypatch):
+    lock = threading.Lock()
+    active = peak = 0
+
+    def fake_fetch(url):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+        if url.endswith("bad"):
+            return None, None, "boom"
+        return f"<p>{url}</p>", {}, None
+
+    monkeypatch.setattr(html_mod, "_fetch_page", fake_fetch)
+    urls = [f"https://e.example/{i}" for i in range(4)] + ["https://e.example/bad"]
+    results = list(html_mod.fetch_urls(urls, max_workers=5))
+    assert results[:4] == [(f"<p>{u}</p>", {}, None) for u in urls[:4]]
+    assert results[4] == (None, None, "boom")
+    assert peak > 1
+
+
+def test_convert_urls_scrubs_before_fetch(monkeypatch, tmp_output_dir):
+    seen = []
+
+    def fake_fetch_urls(urls, max_workers):
+        seen.extend(urls)
+        return [(None, None, "offline")] * len(urls)
+
+    monkeypatch.setattr(html_mod, "fetch_urls", fake_fetch_urls)
+    url = "https://user:pw@e.example/page"
+    results = list(html_mod.convert_urls([url], tmp_output_dir))
+    assert results == [(url, False)]
+    assert seen == ["https://e.example/page"]
+
+
+def test_convert_urls_reads_last_modified_from_get(monkeypatch, tmp_output_dir):
+    page = (
+        "<html><head><title>Dated page</title></head><body><article>"
+        + "<p>Plain paragraph of article text without any date in it.</p>" * 20
+        + "</article></body></html>"
+    )
+    methods = []
+
+    def fake_safe_fetch(url, method="GET"):
+        methods.append(method)
+        headers = {"Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"}
+        return page.encode("utf-8"), headers, None
+
+    monkeypatch.setattr(html_mod, "safe_fetch", fake_safe_fetch)
+    results = list(
+        html_mod.convert_urls(["https://e.example/dated"], tmp_output_dir, force=True)
+    )
+    assert results == [("https://e.example/dated", True)]
+    assert methods == ["GET"]
+    out = (tmp_output_dir / "e_example_dated.md").read_text(encoding="utf-8")
+    fm = yaml.safe_load(out[4 : out.index("\n---\n", 4)])
+    assert str(fm["date"]) == "2015-10-21"
+
+
+def test_convert_urls_converts_while_later_fetches_run(monkeypatch, tmp_output_dir):
+    first_converted = threading.Event()
+    waited = []
+
+    def fake_fetch(url):
+        if url.endswith("slow"):
+            waited.append(first_converted.wait(timeout=5))
+        return "<p>x</p>", {}, None
+
+    def fake_convert(url, page, *_args):
+        first_converted.set()
+        return True
+
+    monkeypatch.setattr(html_mod, "_fetch_page", fake_fetch)
+    monkeypatch.setattr(html_mod, "_convert_fetched", fake_convert)
+    urls = ["https://e.example/fast", "https://e.example/slow"]
+    results = list(html_mod.convert_urls(urls, tmp_output_dir, max_workers=2))
+    assert results == [(u, True) for u in urls]
+    assert waited == [True]
+
+
+def test_fetch_urls_bounds_fetches_ahead_of_consumer(monkeypatch):
+    started = []
+
+    def fake_fetch(url):
+        started.append(url)
+        return "<p>x</p>", {}, None
+
+    monkeypatch.setattr(html_mod, "_fetch_page", fake_fetch)
+    urls = [f"https://e.example/{i}" for i in range(6)]
+    pages = html_mod.fetch_urls(urls, max_workers=2)
+    next(pages)
+    time.sleep(0.1)  # give the pool a chance to run ahead if it could
+    assert len(started) <= 3
+    assert len(list(pages)) == 5
+    assert sorted(started) == sorted(urls)
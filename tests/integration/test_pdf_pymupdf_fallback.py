@@ -74,3 +74,28 @@ def test_pdf_software_creator_routes_to_produced_by(
     fm = yaml.safe_load(out[4:end])
     assert fm["organization"] == ""  # empty when software-creator
     assert fm["produced_by"] == "Adobe InDesign 16.2 (Windows)"
+
+
+def test_pdf_fallback_path_opens_the_file_once(
+    fixture_dir, tmp_output_dir, monkeypatch
+):
+    """Metadata, complexity check, and pymupdf4llm share one Document."""
+    monkeypatch.setattr("any2md.converters.pdf.has_docling", lambda: False)
+    from any2md.converters import pdf as pdf_mod
+
+    real_open = pdf_mod.pymupdf.open
+    calls: list[tuple] = []
+
+    def counting_open(*args, **kwargs):
+        calls.append(args)
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr(pdf_mod.pymupdf, "open", counting_open)
+    ok = convert_pdf(
+        fixture_dir / "multi_column.pdf",
+        tmp_output_dir,
+        options=PipelineOptions(),
+        force=True,
+    )
+    assert ok
+    assert len(calls) == 1
@@ -21,6 +21,16 @@ def test_collapses_three_plus_blank_lines_to_two():
     assert collapse_whitespace(text, PipelineOptions()) == "alpha\n\nbeta"
 
 
+def test_whitespace_only_lines_count_as_blank():
+    text = "alpha  \n \n\t\n\nbeta"
+    assert collapse_whitespace(text, PipelineOptions()) == "alpha\n\nbeta"
+
+
+def test_caps_leading_and_trailing_blank_runs():
+    text = "\n\n\n\nalpha\n\n\n\n"
+    assert collapse_whitespace(text, PipelineOptions()) == "\n\nalpha\n\n"
+
+
 def test_preserves_single_blank_line():
     text = "alpha\n\nbeta"
     assert collapse_whitespace(text, PipelineOptions()) == "alpha\n\nbeta"
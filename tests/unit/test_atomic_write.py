@@ -50,3 +50,28 @@ def test_creates_parent_dir_if_missing(tmp_path):
     out = tmp_path / "deep" / "nested" / "x.md"
     atomic_write_text(out, "hi")
     assert out.read_text(encoding="utf-8") == "hi"
+
+
+def test_writes_sequence_of_parts_back_to_back(tmp_path):
+    out = tmp_path / "x.md"
+    atomic_write_text(out, ['---\ntitle: "é"\n---\n\n', "body\r\n", ""])
+    assert out.read_bytes() == '---\ntitle: "é"\n---\n\nbody\r\n'.encode("utf-8")
+
+
+def test_resumes_after_short_writes(tmp_path, monkeypatch):
+    """A kernel short write must not truncate the output."""
+    real_writev = getattr(os, "writev", None)
+    real_write = os.write
+
+    def short_writev(fd, buffers):
+        return real_write(fd, bytes(buffers[0][:3]))
+
+    def short_write(fd, data):
+        return real_write(fd, bytes(data[:3]))
+
+    if real_writev is not None:
+        monkeypatch.setattr("any2md.utils.os.writev", short_writev)
+    monkeypatch.setattr("any2md.utils.os.write", short_write)
+    out = tmp_path / "x.md"
+    atomic_write_text(out, ["frontmatter\n", "body text\n"])
+    assert out.read_text(encoding="utf-8") == "frontmatter\nbody text\n"
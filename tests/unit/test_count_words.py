@@ -0,0 +1,15 @@
+"""Tests for utils.count_words."""
+
+from any2md import utils
+from any2md.utils import count_words
+
+
+def test_matches_str_split():
+    for text in ("", "   ", "one", " two  words ", "a\nb\tc\r\nd", "é ü　日本"):
+        assert count_words(text) == len(text.split())
+
+
+def test_word_straddling_chunk_boundary_counted_once(monkeypatch):
+    monkeypatch.setattr(utils, "_WORD_COUNT_CHUNK", 4)
+    for text in ("abcdefgh", "ab cdefg h", "abc defgh ", "abcd efgh", " abc    d"):
+        assert count_words(text) == len(text.split())
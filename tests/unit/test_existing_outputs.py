@@ -0,0 +1,13 @@
+"""Tests for cli._existing_outputs."""
+
+from any2md.cli import _existing_outputs
+
+
+def test_lists_output_dir(tmp_path):
+    (tmp_path / "a.md").write_text("x", encoding="utf-8")
+    (tmp_path / "sub").mkdir()
+    assert _existing_outputs(tmp_path) == {"a.md", "sub"}
+
+
+def test_missing_dir_is_empty(tmp_path):
+    assert _existing_outputs(tmp_path / "missing") == frozenset()
@@ -0,0 +1,52 @@
+"""Unit tests for the on-disk extraction cache (any2md/_extract_cache.py)."""
+
+from __future__ import annotations
+
+import json
+
+from any2md import _extract_cache
+from any2md._extract_cache import CachedExtraction
+
+
+def test_key_depends_on_content_and_tag(tmp_path):
+    a = tmp_path / "a.bin"
+    b = tmp_path / "b.bin"
+    a.write_bytes(b"same bytes")
+    b.write_bytes(b"same bytes")
+    assert _extract_cache.cache_key(a, "t") == _extract_cache.cache_key(b, "t")
+    assert _extract_cache.cache_key(a, "t") != _extract_cache.cache_key(a, "u")
+    b.write_bytes(b"other bytes")
+    assert _extract_cache.cache_key(a, "t") != _extract_cache.cache_key(b, "t")
+
+
+def test_store_then_load_roundtrip(tmp_path):
+    entry = CachedExtraction("# Title\n\nbody", "mammoth+markdownify", "text", ["w"])
+    _extract_cache.store(tmp_path, "k", entry)
+    assert (tmp_path / ".cache" / "k.json").is_file()
+    assert _extract_cache.load(tmp_path, "k") == entry
+
+
+def test_load_miss_returns_none(tmp_path):
+    assert _extract_cache.load(tmp_path, "missing") is None
+
+
+def test_load_ignores_corrupt_and_stale_entries(tmp_path):
+    cache_dir = tmp_path / ".cache"
+    cache_dir.mkdir()
+    (cache_dir / "corrupt.json").write_text("{not json")
+    stale = {
+        "version": _extract_cache._CACHE_VERSION + 1,
+        "markdown": "x",
+        "extracted_via": "pymupdf4llm",
+        "lane": "text",
+    }
+    (cache_dir / "stale.json").write_text(json.dumps(stale))
+    bad_lane = dict(stale, version=_extract_cache._CACHE_VERSION, lane="nope")
+    (cache_dir / "bad_lane.json").write_text(json.dumps(bad_lane))
+    assert _extract_cache.load(tmp_path, "corrupt") is None
+    assert _extract_cache.load(tmp_path, "stale") is None
+    assert _extract_cache.load(tmp_path, "bad_lane") is None
+
+
+def test_backend_version_unknown_dist():
+    assert _extract_cache.backend_version("no-such-dist-any2md") == "unknown"
@@ -2,7 +2,7 @@
 
 import yaml
 
-from any2md.frontmatter import SourceMeta, compose
+from any2md.frontmatter import SourceMeta, compose, compose_parts
 from any2md.pipeline import PipelineOptions
 
 
@@ -226,3 +226,11 @@ def test_compose_meta_authors_takes_priority():
     out = compose(body, _meta(authors=["Bob"]), PipelineOptions())
     fm, _ = _split_frontmatter(out)
     assert fm["authors"] == ["Bob"]
+
+
+def test_compose_parts_split_matches_compose():
+    body = "# Title\r\n\ncafe\u0301 body\r\n"
+    header, out_body = compose_parts(body, _meta(), PipelineOptions())
+    assert header.startswith("---\n") and header.endswith("---\n\n")
+    assert out_body == "# Title\n\ncaf\u00e9 body\n"
+    assert header + out_body == compose(body, _meta(), PipelineOptions())
@@ -2,8 +2,11 @@
 
 import dataclasses
 
+import yaml
+
 from any2md.frontmatter import (
     SourceMeta,
+    _yaml_escape,
     derive_title,
     estimate_tokens,
     extract_abstract,
@@ -135,3 +138,18 @@ def test_derive_title_falls_back_to_filename_when_neither():
 def test_derive_title_strips_markdown_emphasis_in_h1():
     body = "# **Bold Title** _emphasis_\n"
     assert derive_title(body, title_hint=None, fallback="x") == "Bold Title emphasis"
+
+
+def test_yaml_escape_round_trips_through_yaml():
+    for value in ["plain", 'say "hi"', "back\\slash", "two\nlines\r", 'é\\"\n']:
+        assert yaml.safe_load(f'"{_yaml_escape(value)}"') == value
+
+
+def test_derive_title_finds_h1_after_long_preamble():
+    body = "cover text\n" * 1000 + "## Not this\n#hashtag\n# Late Heading\n"
+    assert derive_title(body, title_hint="Hint", fallback="x") == "Late Heading"
+
+
+def test_derive_title_matches_h1_at_body_start_or_not_at_all():
+    assert derive_title("# First\n", title_hint=None, fallback="x") == "First"
+    assert derive_title("no # heading\n", title_hint="Hint", fallback="x") == "Hint"
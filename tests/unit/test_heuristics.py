@@ -314,6 +314,16 @@ class TestRefineAbstract:
         assert result is None
 
 
+@pytest.mark.parametrize(
+    "text",
+    ["", "one", "a\n\nb", "a\n \t\nb\n\n\n\nc", "\n\nlead\n\n", "x\n\r\n\ny"],
+)
+def test_iter_paragraphs_matches_split(text):
+    assert list(heuristics.iter_paragraphs(text)) == heuristics._PARA_SPLIT_RE.split(
+        text
+    )
+
+
 # --------------------------------------------------------------------- #
 # extract_authors
 # --------------------------------------------------------------------- #
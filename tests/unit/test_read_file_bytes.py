@@ -0,0 +1,16 @@
+"""Tests for utils.read_file_bytes."""
+
+from any2md.utils import read_file_bytes
+
+
+def test_reads_whole_file(tmp_path):
+    data = bytes(range(256)) * 4097
+    p = tmp_path / "blob.bin"
+    p.write_bytes(data)
+    assert read_file_bytes(p) == data
+
+
+def test_empty_file(tmp_path):
+    p = tmp_path / "empty.bin"
+    p.write_bytes(b"")
+    assert read_file_bytes(p) == b""
@@ -0,0 +1,36 @@
+"""Tests for sanitize_filename."""
+
+from __future__ import annotations
+
+import pytest
+
+from any2md import utils
+from any2md.utils import sanitize_filename
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("report.pdf", "report.md"),
+        ("My Report 2024.docx", "My_Report_2024.md"),
+        ("a, b; c: d.pdf", "a_b_c_d.md"),
+        ('it\'s "quoted".txt', "its_quoted.md"),
+        ("en–dash — em.pdf", "endash_em.md"),
+        ("ctl\x00\x1f\x7fchars.pdf", "ctlchars.md"),
+        ("back\\slash.pdf", "backslash.md"),
+        ("  __ spaced __  .pdf", "spaced.md"),
+        ("résumé 日本.pdf", "résumé_日本.md"),
+        (",;:.pdf", "untitled.md"),
+    ],
+)
+def test_sanitize_filename(raw, expected):
+    assert sanitize_filename(raw) == expected
+
+
+def test_ascii_fast_path_matches_str_table():
+    for code in range(0x80):
+        stem = f"a{chr(code)}b"
+        via_bytes = stem.encode("ascii").translate(
+            utils._FILENAME_BYTES_TABLE, utils._FILENAME_BYTES_DELETE
+        )
+        assert via_bytes.decode("ascii") == stem.translate(utils._FILENAME_TABLE)
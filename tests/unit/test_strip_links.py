@@ -0,0 +1,12 @@
+"""Tests for utils.strip_links."""
+
+from any2md.utils import strip_links
+
+
+def test_replaces_links_with_display_text():
+    assert strip_links("see [docs](https://x.example/a) and [b](c)") == "see docs and b"
+
+
+def test_link_free_text_returned_unchanged():
+    text = "no links [here] (or here)\n" * 3
+    assert strip_links(text) is text
@@ -0,0 +1,20 @@
+"""Tests for the convert_many process-pool worker initializer."""
+
+from any2md import converters
+
+
+def test_init_worker_sets_output_mode_and_preloads(monkeypatch):
+    imported = []
+
+    def fake_import(name):
+        imported.append(name)
+        if name == "any2md.converters.txt":
+            raise ImportError(name)
+
+    monkeypatch.setattr(converters.importlib, "import_module", fake_import)
+    try:
+        converters._init_worker(True, False, frozenset({".pdf", ".txt", ".xyz"}))
+        assert converters.is_quiet()
+    finally:
+        converters.set_output_mode()
+    assert imported == ["any2md.converters.pdf", "any2md.converters.txt"]